@@ -7,9 +7,7 @@ Demo script για Convex Hull algorithms.
 
 import sys
 import os
-import random
 import numpy as np
-from typing import List
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -23,56 +21,40 @@ from src.utils.performance import Timer
 def generate_random_points(n: int, 
                          x_range: tuple = (0, 100), 
                          y_range: tuple = (0, 100),
-                         seed: int = None) -> List[Point2D]:
-    """Δημιουργεί n τυχαία σημεία"""
+                         seed: int = None) -> np.ndarray:
+    """Δημιουργεί n τυχαία σημεία ως ndarray shape (n, 2)"""
     if seed:
-        random.seed(seed)
         np.random.seed(seed)
     
-    points = []
-    for _ in range(n):
-        x = random.uniform(x_range[0], x_range[1])
-        y = random.uniform(y_range[0], y_range[1])
-        points.append(Point2D(x, y))
-    
-    return points
+    low = (x_range[0], y_range[0])
+    high = (x_range[1], y_range[1])
+    return np.random.uniform(low, high, (n, 2))
 
 
 def generate_circle_points(n: int, 
                          center: tuple = (50, 50), 
                          radius: float = 40,
-                         noise: float = 0) -> List[Point2D]:
-    """Δημιουργεί σημεία σε κύκλο (με προαιρετικό θόρυβο)"""
-    points = []
+                         noise: float = 0) -> np.ndarray:
+    """Δημιουργεί σημεία σε κύκλο (με προαιρετικό θόρυβο) ως ndarray shape (n, 2)"""
     angles = np.linspace(0, 2*np.pi, n, endpoint=False)
+    r = radius + np.random.uniform(-noise, noise, n)
     
-    for angle in angles:
-        r = radius + random.uniform(-noise, noise)
-        x = center[0] + r * np.cos(angle)
-        y = center[1] + r * np.sin(angle)
-        points.append(Point2D(x, y))
-    
-    return points
+    xs = center[0] + r * np.cos(angles)
+    ys = center[1] + r * np.sin(angles)
+    return np.column_stack([xs, ys])
 
 
 def generate_clusters(n_clusters: int = 3, 
                      points_per_cluster: int = 20,
-                     cluster_std: float = 5) -> List[Point2D]:
-    """Δημιουργεί σημεία σε clusters"""
-    points = []
-    
-    for _ in range(n_clusters):
-        # Random cluster center
-        cx = random.uniform(20, 80)
-        cy = random.uniform(20, 80)
-        
-        # Generate points around center
-        for _ in range(points_per_cluster):
-            x = np.random.normal(cx, cluster_std)
-            y = np.random.normal(cy, cluster_std)
-            points.append(Point2D(x, y))
+                     cluster_std: float = 5) -> np.ndarray:
+    """Δημιουργεί σημεία σε clusters ως ndarray shape (n_clusters * points_per_cluster, 2)"""
+    # Random cluster centers
+    centers = np.random.uniform(20, 80, (n_clusters, 2))
     
-    return points
+    # Generate points around each center
+    points = np.random.normal(centers[:, None, :], cluster_std,
+                              (n_clusters, points_per_cluster, 2))
+    return points.reshape(-1, 2)
 
 
 def demo_basic():
@@ -163,7 +145,7 @@ def demo_performance():
     for size in sizes:
         points = generate_random_points(size, seed=42)
         
-        with Timer(f"Size {size}") as timer:
+        with Timer(f"Size {size}", verbose=False) as timer:
             hull = compute_convex_hull(points)
         
         print(f"{size:10d} | {timer.elapsed:14.6f} | {len(hull):13d}")
@@ -0,0 +1,34 @@
+"""
+Build script για τα προαιρετικά Cython extensions του project.
+
+Χρήση (μόνο από το checkout του repo):
+    python setup.py build_ext --inplace
+
+Το project τρέχει απευθείας από το checkout και το setup.py δεν δηλώνει
+packages: δεν προορίζεται για `pip install .`, που θα έδινε κενή εγκατάσταση.
+Χωρίς εγκατεστημένο Cython τα extensions παραλείπονται και ο κώδικας
+χρησιμοποιεί τους Numba/Python kernels.
+"""
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+extensions = [
+    Extension("src.convex_hull._graham", ["src/convex_hull/_graham.pyx"]),
+]
+
+if cythonize is not None:
+    ext_modules = cythonize(extensions, compiler_directives={"language_level": "3"})
+else:
+    print("Cython not found: skipping the optional extensions")
+    ext_modules = []
+
+setup(
+    name="multi-data-structs",
+    ext_modules=ext_modules,
+)
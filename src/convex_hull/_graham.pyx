@@ -0,0 +1,57 @@
+# cython: language_level=3
+"""
+Cython kernel για τον βρόχο του Graham scan.
+
+Προαιρετικό extension: χτίζεται με `python setup.py build_ext --inplace`.
+Αν δεν είναι διαθέσιμο, το ConvexHull2D χρησιμοποιεί τον Numba/Python kernel.
+"""
+
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _scan(double[::1] xs, double[::1] ys, Py_ssize_t[::1] order,
+                      Py_ssize_t[::1] stack) nogil:
+    """Γεμίζει το stack με τους δείκτες του hull και επιστρέφει το μήκος του"""
+    cdef Py_ssize_t n = order.shape[0]
+    cdef Py_ssize_t top = 0
+    cdef Py_ssize_t k, a, b, c
+    
+    for k in range(n):
+        c = order[k]
+        # Αφαίρεσε σημεία που δημιουργούν δεξιά στροφή (ή είναι συνευθειακά)
+        while top > 1:
+            a = stack[top - 2]
+            b = stack[top - 1]
+            if (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a]) > 0:
+                break
+            top -= 1
+        stack[top] = c
+        top += 1
+    
+    return top
+
+
+def graham_scan_kernel(double[::1] xs, double[::1] ys, Py_ssize_t[::1] order):
+    """
+    Ο βρόχος του Graham scan πάνω σε contiguous float64 arrays.
+    
+    Args:
+        xs, ys: Συντεταγμένες όλων των σημείων
+        order: Δείκτες (np.intp) των υποψήφιων σημείων σε σειρά πολικής γωνίας,
+               με πρώτο το σημείο εκκίνησης
+    
+    Returns:
+        Δείκτες των vertices του hull σε counter-clockwise σειρά
+    """
+    stack = np.empty(order.shape[0], dtype=np.intp)
+    cdef Py_ssize_t[::1] stack_view = stack
+    cdef Py_ssize_t top
+    
+    with nogil:
+        top = _scan(xs, ys, order, stack_view)
+    
+    return stack[:top]
@@ -1,103 +1,429 @@
 # src/convex_hull/convex_hull_2d.py
 """
-2D Convex Hull implementation using Graham Scan algorithm.
+2D Convex Hull implementation using Andrew's Monotone Chain and Graham Scan.
 
-Ο αλγόριθμος Graham Scan βρίσκει το convex hull ενός συνόλου σημείων
-σε O(n log n) χρόνο.
+Και οι δύο αλγόριθμοι βρίσκουν το convex hull ενός συνόλου σημείων
+σε O(n log n) χρόνο. Ο Monotone Chain (default) ταξινομεί λεξικογραφικά
+κατά (x, y) και δεν χρειάζεται καθόλου γωνίες.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocessing
 import sys
 import os
 
+import numpy as np
+
 # Προσθήκη του src directory στο path για imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.utils.geometry import Point2D, ccw, polar_angle
+from src.utils.geometry import Point2D
 from src.utils.performance import measure_time
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Το numba είναι προαιρετικό: χωρίς αυτό οι kernels τρέχουν ως απλή Python/NumPy
+    NUMBA_AVAILABLE = False
+
+    def _identity_decorator(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    njit = _identity_decorator
+
+try:
+    # Προαιρετικό Cython extension (βλ. setup.py)
+    from src.convex_hull._graham import graham_scan_kernel as _cython_graham_scan_kernel
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+
+@njit(cache=True)
+def orientation_arr(ax, ay, bx, by, cx, cy):
+    """
+    Vectorized cross product (b - a) x (c - a) για arrays συντεταγμένων.
+    
+    Μεταγλωττίζεται lazily ξεχωριστά για κάθε dtype, οπότε με float32 input
+    ο υπολογισμός και το αποτέλεσμα μένουν σε float32. Χωρίς numba είναι
+    απλή NumPy έκφραση.
+    
+    Returns:
+        > 0: Counterclockwise, < 0: Clockwise, 0: Collinear
+    """
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+@njit(cache=True)
+def _graham_scan_kernel(xs, ys, order):
+    """
+    Ο βρόχος του Graham scan πάνω σε contiguous float64 arrays.
+    
+    Args:
+        xs, ys: Συντεταγμένες όλων των σημείων
+        order: Δείκτες των υποψήφιων σημείων σε σειρά πολικής γωνίας,
+               με πρώτο το σημείο εκκίνησης
+    
+    Returns:
+        Δείκτες των vertices του hull σε counter-clockwise σειρά
+    """
+    n = len(order)
+    stack = np.empty(n, dtype=np.int64)
+    top = 0
+    
+    for k in range(n):
+        i = order[k]
+        # Αφαίρεσε σημεία που δημιουργούν δεξιά στροφή (ή είναι συνευθειακά)
+        while top > 1:
+            s0 = stack[top - 2]
+            s1 = stack[top - 1]
+            cross = (xs[s1] - xs[s0]) * (ys[i] - ys[s0]) - (ys[s1] - ys[s0]) * (xs[i] - xs[s0])
+            if cross > 0:
+                break
+            top -= 1
+        stack[top] = i
+        top += 1
+    
+    return stack[:top]
+
+
+@njit(cache=True)
+def _monotone_chain_kernel(xs, ys, order):
+    """
+    Τα δύο γραμμικά περάσματα του Andrew's Monotone Chain.
+    
+    Args:
+        xs, ys: Συντεταγμένες όλων των σημείων
+        order: Δείκτες των σημείων ταξινομημένοι κατά (x, y)
+    
+    Returns:
+        Δείκτες των vertices του hull σε counter-clockwise σειρά,
+        ξεκινώντας από το αριστερότερο σημείο
+    """
+    n = len(order)
+    stack = np.empty(2 * n, dtype=np.int64)
+    top = 0
+    
+    # Κάτω hull: από αριστερά προς τα δεξιά
+    for k in range(n):
+        i = order[k]
+        # Σημείο ίδιο με την κορυφή του stack: ακμή μηδενικού μήκους
+        if top > 0 and xs[i] == xs[stack[top - 1]] and ys[i] == ys[stack[top - 1]]:
+            continue
+        while top > 1:
+            s0 = stack[top - 2]
+            s1 = stack[top - 1]
+            cross = (xs[s1] - xs[s0]) * (ys[i] - ys[s0]) - (ys[s1] - ys[s0]) * (xs[i] - xs[s0])
+            if cross > 0:
+                break
+            top -= 1
+        stack[top] = i
+        top += 1
+    
+    # Πάνω hull: από δεξιά προς τα αριστερά, χωρίς να πειράξουμε το κάτω
+    lower_size = top + 1
+    for k in range(n - 2, -1, -1):
+        i = order[k]
+        if xs[i] == xs[stack[top - 1]] and ys[i] == ys[stack[top - 1]]:
+            continue
+        while top >= lower_size:
+            s0 = stack[top - 2]
+            s1 = stack[top - 1]
+            cross = (xs[s1] - xs[s0]) * (ys[i] - ys[s0]) - (ys[s1] - ys[s0]) * (xs[i] - xs[s0])
+            if cross > 0:
+                break
+            top -= 1
+        stack[top] = i
+        top += 1
+    
+    # Το τελευταίο σημείο είναι ξανά το πρώτο, εκτός αν όλα τα σημεία
+    # ταυτίζονται και το stack έχει ένα μόνο σημείο
+    if top == 1:
+        return stack[:1]
+    return stack[:top - 1]
+
+
+def _run_kernel(kernel, xs: np.ndarray, ys: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Καλεί έναν kernel, περνώντας Python lists όταν δεν υπάρχει numba"""
+    if NUMBA_AVAILABLE:
+        return kernel(xs, ys, order)
+    # Χωρίς JIT, το indexing σε lists είναι πολύ φθηνότερο από ό,τι σε NumPy arrays
+    return np.asarray(kernel(xs.tolist(), ys.tolist(), order.tolist()), dtype=np.int64)
+
+
+def _akl_toussaint_filter(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Akl–Toussaint heuristic: απορρίπτει σε O(n) τα σημεία που βρίσκονται
+    αυστηρά μέσα στο πολύγωνο των ακραίων σημείων, αφού δεν μπορούν να
+    είναι vertices του hull.
+    
+    Χρησιμοποιούνται τα ακραία σημεία σε 8 κατευθύνσεις (y, x - y, x, x + y
+    και οι αντίθετές τους): για ομοιόμορφα σημεία σε τετράγωνο το οκτάγωνο
+    απορρίπτει πάνω από 90% του input, ενώ το τετράπλευρο των min/max x, y
+    μόνο το μισό.
+    
+    Returns:
+        Δείκτες των σημείων που βρίσκονται πάνω ή έξω από το πολύγωνο
+    """
+    sums = xs + ys
+    diffs = xs - ys
+    # Τα ακραία σημεία σε counter-clockwise σειρά, ξεκινώντας από το κατώτατο
+    extremes = [ys.argmin(), diffs.argmax(), xs.argmax(), sums.argmax(),
+                ys.argmax(), diffs.argmin(), xs.argmin(), sums.argmin()]
+    # Ένα σημείο μπορεί να είναι ακραίο σε διαδοχικές κατευθύνσεις
+    polygon = [v for i, v in enumerate(extremes) if v != extremes[i - 1]]
+    
+    if len(polygon) < 3:
+        return np.arange(len(xs))
+    
+    inside = np.ones(len(xs), dtype=bool)
+    for a, b in zip(polygon, polygon[1:] + polygon[:1]):
+        # Αυστηρά αριστερά της ακμής a -> b
+        inside &= orientation_arr(xs[a], ys[a], xs[b], ys[b], xs, ys) > 0
+    
+    return np.flatnonzero(~inside)
+
+
+def _monotone_chain_indices(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Δείκτες του convex hull των (xs, ys) με Andrew's Monotone Chain"""
+    candidates = _akl_toussaint_filter(xs, ys)
+    order = candidates[np.lexsort((ys[candidates], xs[candidates]))]
+    return _run_kernel(_monotone_chain_kernel, xs, ys, order)
+
+
+# Τα arrays του parallel_hull, ορισμένα μόνο μέσα στα worker processes
+_parallel_xs = None
+_parallel_ys = None
+
+
+def _init_worker(xs: np.ndarray, ys: np.ndarray) -> None:
+    """
+    Initializer των workers του parallel_hull.
+    
+    Με fork τα initargs κληρονομούνται από τον parent χωρίς pickling, οπότε
+    τα arrays δεν αντιγράφονται και κάθε task δέχεται μόνο τα όρια του
+    υποσυνόλου του. Ο parent δεν αγγίζει ποτέ το module state.
+    """
+    global _parallel_xs, _parallel_ys
+    _parallel_xs, _parallel_ys = xs, ys
+
+
+def _chunk_hull_indices(bounds: tuple) -> np.ndarray:
+    """Δείκτες του hull του υποσυνόλου [start, stop) των κοινών arrays"""
+    start, stop = bounds
+    local = _monotone_chain_indices(_parallel_xs[start:stop], _parallel_ys[start:stop])
+    return local + start
+
+
+# Πειραματικό όριο. Το σταθερό κόστος του process pool (fork και συλλογή
+# αποτελεσμάτων) μετρήθηκε ~35 ms, ενώ ο σειριακός Monotone Chain θέλει ~30 ms
+# για 1M και ~250 ms για 5M ομοιόμορφα σημεία. Με k πυρήνες το parallel_hull
+# κερδίζει μόνο όταν ο σειριακός χρόνος T ικανοποιεί T * (1 - 1/k) > 35 ms,
+# δηλαδή από μερικά εκατομμύρια σημεία και πάνω. Το κέρδος δεν έχει μετρηθεί
+# σε multi-core μηχάνημα.
+PARALLEL_MIN_POINTS = 5_000_000
+# Υποσύνολα ανά worker, για καλύτερο load balancing
+PARALLEL_CHUNKS_PER_WORKER = 2
+
 
 class ConvexHull2D:
     """Κλάση για υπολογισμό 2D Convex Hull"""
     
-    def __init__(self, points: List[Point2D]):
+    def __init__(self, points: Union[np.ndarray, List[Point2D]], precision: str = "float64"):
         """
-        Initialize με λίστα από 2D σημεία.
+        Initialize με λίστα από 2D σημεία ή με ndarray shape (n, 2).
+        
+        Τα σημεία αποθηκεύονται εσωτερικά ως Struct-of-Arrays (δύο contiguous
+        buffers xs, ys), ώστε η ταξινόμηση και οι γεωμετρικοί υπολογισμοί να
+        γίνονται vectorized με NumPy. Με ndarray input δεν δημιουργούνται
+        καθόλου Point2D objects και το hull επιστρέφεται ως ndarray shape (h, 2).
+        
+        Με precision="float32" τα buffers έχουν το μισό μέγεθος και όλοι οι
+        γεωμετρικοί έλεγχοι γίνονται σε 32-bit. Ο float32 έχει ~7 σημαντικά
+        ψηφία: για συντεταγμένες με μέτρο έως ~1e3 (π.χ. το [0, 100] των demos)
+        η ανάλυση είναι ~1e-4, και μόνο σημεία συνευθειακά ή ταυτόσημα μέσα σε
+        αυτή την ανοχή μπορεί να ταξινομηθούν διαφορετικά από ό,τι με float64.
+        Για μεγαλύτερο εύρος συντεταγμένων χρησιμοποιήστε το default float64.
+        Τα σημεία του hull που επιστρέφονται είναι πάντα αυτά του input.
         
         Args:
-            points: Λίστα από Point2D objects
+            points: Λίστα από Point2D objects ή ndarray shape (n, 2)
+            precision: "float64" (default) ή "float32"
         """
+        if precision not in ("float32", "float64"):
+            raise ValueError(f"Unknown precision: {precision}")
+        
+        if isinstance(points, np.ndarray) and (points.ndim != 2 or points.shape[1] != 2):
+            raise ValueError(f"Αναμενόταν ndarray shape (n, 2), δόθηκε {points.shape}")
+        
         if len(points) < 3:
             raise ValueError("Χρειάζονται τουλάχιστον 3 σημεία για convex hull")
         
+        dtype = np.dtype(precision)
         self.points = points
+        if isinstance(points, np.ndarray):
+            self.xs = np.ascontiguousarray(points[:, 0], dtype=dtype)
+            self.ys = np.ascontiguousarray(points[:, 1], dtype=dtype)
+        else:
+            self.xs = np.fromiter((p.x for p in points), dtype=dtype, count=len(points))
+            self.ys = np.fromiter((p.y for p in points), dtype=dtype, count=len(points))
         self.hull = []
+        self.hull_indices = np.empty(0, dtype=np.int64)
+        # Οι συντεταγμένες των vertices του hull, επίσης ως SoA
+        self.hull_xs = np.empty(0, dtype=np.float64)
+        self.hull_ys = np.empty(0, dtype=np.float64)
     
-    def graham_scan(self) -> List[Point2D]:
+    def graham_scan(self) -> Union[np.ndarray, List[Point2D]]:
         """
         Υλοποίηση του Graham Scan algorithm.
         
         Returns:
-            Λίστα με τα σημεία του convex hull σε counter-clockwise σειρά
+            Τα σημεία του convex hull σε counter-clockwise σειρά, στον ίδιο
+            τύπο με το input (λίστα Point2D ή ndarray shape (h, 2))
         """
-        # Βήμα 1: Βρες το κατώτατο σημείο (με το μικρότερο y, και σε περίπτωση ισοπαλίας το μικρότερο x)
-        start = min(self.points, key=lambda p: (p.y, p.x))
+        xs, ys = self.xs, self.ys
         
-        # Βήμα 2: Ταξινόμησε τα υπόλοιπα σημεία κατά πολική γωνία ως προς το start
-        other_points = [p for p in self.points if p != start]
+        # Βήμα 0: Απόρριψη των σημείων που σίγουρα είναι εσωτερικά
+        survivors = _akl_toussaint_filter(xs, ys)
         
-        # Ταξινόμηση κατά πολική γωνία, και κατά απόσταση σε περίπτωση ίδιας γωνίας
-        sorted_points = sorted(other_points, 
-                             key=lambda p: (polar_angle(start, p), 
-                                          start.distance_to(p)))
+        # Βήμα 1: Βρες το κατώτατο σημείο (με το μικρότερο y, και σε περίπτωση ισοπαλίας το μικρότερο x)
+        start = int(survivors[np.lexsort((xs[survivors], ys[survivors]))[0]])
+        
+        # Βήμα 2: Ταξινόμησε τα υπόλοιπα σημεία κατά πολική γωνία ως προς το start.
+        # Το start (και τυχόν διπλότυπά του) έχει μηδενική απόσταση και αφαιρείται.
+        dx = xs[survivors] - xs[start]
+        dy = ys[survivors] - ys[start]
+        dist2 = dx * dx + dy * dy
+        nonzero = dist2 > 0
+        others = survivors[nonzero]
+        dx, dy, dist2 = dx[nonzero], dy[nonzero], dist2[nonzero]
         
-        # Βήμα 3: Αφαίρεσε σημεία με την ίδια γωνία (κράτα μόνο το πιο μακρινό)
-        filtered_points = self._remove_same_angle_points(start, sorted_points)
+        # Όλα τα σημεία βρίσκονται στο άνω ημιεπίπεδο του start με γωνία στο [0, π),
+        # οπότε το -dx/dy (αρνητική συνεφαπτομένη) είναι γνησίως αύξουσα συνάρτηση
+        # της γωνίας και αρκεί ως κλειδί ταξινόμησης χωρίς atan2. Τα σημεία με dy == 0
+        # έχουν γωνία 0 και παίρνουν κλειδί -inf.
+        pseudo_angle = np.full(len(others), -np.inf, dtype=dx.dtype)
+        np.divide(-dx, dy, out=pseudo_angle, where=dy > 0)
         
-        # Αν έχουμε λιγότερα από 2 σημεία μετά το filtering, επέστρεψε απλό hull
-        if len(filtered_points) < 2:
-            return [start] + filtered_points
+        # Ίδια γωνία: πρώτα το πιο μακρινό σημείο, ώστε με ένα γραμμικό πέρασμα
+        # να κρατηθεί μόνο αυτό από κάθε ομάδα σημείων με ίδια γωνία
+        perm = np.lexsort((-dist2, pseudo_angle))
+        sorted_angle = pseudo_angle[perm]
+        keep = np.empty(len(perm), dtype=bool)
+        keep[:1] = True
+        keep[1:] = sorted_angle[1:] != sorted_angle[:-1]
+        order = others[perm[keep]]
+        candidates = np.concatenate(([start], order)).astype(np.intp)
         
-        # Βήμα 4: Graham scan
-        hull = [start, filtered_points[0], filtered_points[1]]
+        # Βήμα 3: Graham scan
+        # Το Cython extension δέχεται μόνο float64 buffers
+        if CYTHON_AVAILABLE and xs.dtype == np.float64:
+            hull_indices = _cython_graham_scan_kernel(xs, ys, candidates)
+        else:
+            hull_indices = _run_kernel(_graham_scan_kernel, xs, ys, candidates)
+        return self._set_hull(hull_indices)
+    
+    def andrew_monotone_chain(self) -> Union[np.ndarray, List[Point2D]]:
+        """
+        Υλοποίηση του Andrew's Monotone Chain algorithm.
         
-        for i in range(2, len(filtered_points)):
-            # Αφαίρεσε σημεία που δημιουργούν δεξιά στροφή
-            while len(hull) > 1 and not ccw(hull[-2], hull[-1], filtered_points[i]):
-                hull.pop()
-            hull.append(filtered_points[i])
+        Μία λεξικογραφική ταξινόμηση κατά (x, y) και δύο γραμμικά περάσματα
+        με cross products για το κάτω και το πάνω hull.
         
-        self.hull = hull
-        return hull
+        Returns:
+            Τα σημεία του convex hull σε counter-clockwise σειρά, στον ίδιο
+            τύπο με το input (λίστα Point2D ή ndarray shape (h, 2))
+        """
+        return self._set_hull(_monotone_chain_indices(self.xs, self.ys))
     
-    def _remove_same_angle_points(self, origin: Point2D, points: List[Point2D]) -> List[Point2D]:
+    def parallel_hull(self, num_workers: Optional[int] = None) -> Union[np.ndarray, List[Point2D]]:
         """
-        Αφαιρεί σημεία με την ίδια πολική γωνία, κρατώντας μόνο το πιο μακρινό.
+        Divide-and-conquer convex hull σε πολλαπλούς πυρήνες (πειραματικό).
+        
+        Τα σημεία χωρίζονται σε PARALLEL_CHUNKS_PER_WORKER * num_workers
+        υποσύνολα, το hull κάθε υποσυνόλου υπολογίζεται με Monotone Chain σε
+        ξεχωριστό process, και ένα τελικό σειριακό πέρασμα τρέχει μόνο πάνω
+        στα vertices των επιμέρους hulls. Τα workers δημιουργούνται με fork και
+        κληρονομούν τα σημεία μέσω του initializer, οπότε η μέθοδος μπορεί να
+        καλείται ταυτόχρονα από πολλά threads.
+        
+        Μετά το point culling ο σειριακός αλγόριθμος είναι ήδη πολύ γρήγορος
+        (~3 ms για 100k σημεία), ενώ μόνο το process pool κοστίζει ~35 ms.
+        Γι' αυτό για λιγότερα από PARALLEL_MIN_POINTS σημεία, για ένα worker ή
+        σε πλατφόρμες χωρίς fork εκτελείται ο σειριακός αλγόριθμος.
+        
+        Args:
+            num_workers: Πλήθος processes (default: os.cpu_count())
+        
+        Returns:
+            Τα σημεία του convex hull σε counter-clockwise σειρά, στον ίδιο
+            τύπο με το input (λίστα Point2D ή ndarray shape (h, 2))
         """
-        if not points:
-            return []
+        n = len(self.xs)
+        num_workers = num_workers or os.cpu_count() or 1
+        
+        if (n < PARALLEL_MIN_POINTS or num_workers < 2
+                or "fork" not in multiprocessing.get_all_start_methods()):
+            return self.andrew_monotone_chain()
         
-        filtered = [points[0]]
+        # Κάθε υποσύνολο πρέπει να έχει τουλάχιστον 3 σημεία
+        n_chunks = min(PARALLEL_CHUNKS_PER_WORKER * num_workers, n // 3)
+        edges = np.linspace(0, n, n_chunks + 1).astype(np.int64).tolist()
         
-        for i in range(1, len(points)):
-            angle_prev = polar_angle(origin, filtered[-1])
-            angle_curr = polar_angle(origin, points[i])
-            
-            if abs(angle_prev - angle_curr) < 1e-9:  # Ίδια γωνία
-                # Κράτα το πιο μακρινό
-                if origin.distance_to(points[i]) > origin.distance_to(filtered[-1]):
-                    filtered[-1] = points[i]
-            else:
-                filtered.append(points[i])
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 mp_context=multiprocessing.get_context("fork"),
+                                 initializer=_init_worker,
+                                 initargs=(self.xs, self.ys)) as executor:
+            candidates = np.concatenate(list(executor.map(_chunk_hull_indices,
+                                                          zip(edges[:-1], edges[1:]))))
         
-        return filtered
+        # Τελικό hull πάνω στα vertices των επιμέρους hulls
+        local = _monotone_chain_indices(self.xs[candidates], self.ys[candidates])
+        return self._set_hull(candidates[local])
+    
+    def _set_hull(self, indices: np.ndarray) -> Union[np.ndarray, List[Point2D]]:
+        """
+        Αποθηκεύει το hull που βρέθηκε στους δοσμένους δείκτες του input.
+        
+        Returns:
+            Τα σημεία του hull στον τύπο του input
+        """
+        self.hull_indices = indices
+        
+        # Οι συντεταγμένες του hull παίρνονται από το αρχικό input και όχι από
+        # τα xs/ys, ώστε με precision="float32" το εμβαδόν και η περίμετρος να
+        # υπολογίζονται σε float64 από τις πραγματικές τιμές
+        if isinstance(self.points, np.ndarray):
+            self.hull = self.points[indices]
+            self.hull_xs = self.hull[:, 0].astype(np.float64)
+            self.hull_ys = self.hull[:, 1].astype(np.float64)
+        else:
+            self.hull = [self.points[i] for i in indices]
+            self.hull_xs = np.fromiter((p.x for p in self.hull), dtype=np.float64, count=len(self.hull))
+            self.hull_ys = np.fromiter((p.y for p in self.hull), dtype=np.float64, count=len(self.hull))
+        return self.hull
     
     @measure_time
-    def compute_hull(self) -> List[Point2D]:
-        """Wrapper method με time measurement"""
-        return self.graham_scan()
+    def compute_hull(self, algorithm: str = "andrew") -> Union[np.ndarray, List[Point2D]]:
+        """
+        Wrapper method με time measurement.
+        
+        Args:
+            algorithm: "andrew" (default) ή "graham"
+        """
+        if algorithm == "andrew":
+            return self.andrew_monotone_chain()
+        elif algorithm == "graham":
+            return self.graham_scan()
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
     
-    def get_hull_vertices(self) -> List[Point2D]:
+    def get_hull_vertices(self) -> Union[np.ndarray, List[Point2D]]:
         """Επιστρέφει τα vertices του hull"""
         return self.hull
     
@@ -105,32 +431,24 @@ class ConvexHull2D:
         """
         Υπολογίζει το εμβαδόν του convex hull χρησιμοποιώντας τον τύπο Shoelace.
         """
-        if len(self.hull) < 3:
+        if len(self.hull_xs) < 3:
             return 0.0
         
-        area = 0.0
-        n = len(self.hull)
+        hxs, hys = self.hull_xs, self.hull_ys
+        area = np.dot(hxs, np.roll(hys, -1)) - np.dot(hys, np.roll(hxs, -1))
         
-        for i in range(n):
-            j = (i + 1) % n
-            area += self.hull[i].x * self.hull[j].y
-            area -= self.hull[j].x * self.hull[i].y
-        
-        return abs(area) / 2.0
+        return float(abs(area) / 2.0)
     
     def get_hull_perimeter(self) -> float:
         """Υπολογίζει την περίμετρο του convex hull"""
-        if len(self.hull) < 2:
+        if len(self.hull_xs) < 2:
             return 0.0
         
-        perimeter = 0.0
-        n = len(self.hull)
-        
-        for i in range(n):
-            j = (i + 1) % n
-            perimeter += self.hull[i].distance_to(self.hull[j])
+        # Κλείσιμο του polygon επαναλαμβάνοντας το πρώτο vertex
+        xs_closed = np.append(self.hull_xs, self.hull_xs[0])
+        ys_closed = np.append(self.hull_ys, self.hull_ys[0])
         
-        return perimeter
+        return float(np.hypot(np.diff(xs_closed), np.diff(ys_closed)).sum())
 
 
 def quick_hull(points: List[Point2D]) -> List[Point2D]:
@@ -142,21 +460,67 @@ def quick_hull(points: List[Point2D]) -> List[Point2D]:
     pass
 
 
+# Memoized hulls για ndarray input: κλειδί -> hull, σε σειρά χρήσης (LRU)
+_HULL_CACHE: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+HULL_CACHE_SIZE = 32
+
+
+def _cached_hull(points: np.ndarray, algorithm: str, precision: str) -> np.ndarray:
+    """
+    Memoized convex hull για ndarray input.
+    
+    Το κλειδί είναι ένα SHA-1 digest ολόκληρου του περιεχομένου του array
+    μαζί με shape και dtype, οπότε ένα array που άλλαξε in-place δεν επιστρέφει
+    ποτέ παλιό αποτέλεσμα. Στο cache αποθηκεύονται μόνο τα (μικρά) hulls, όχι
+    τα σημεία.
+    """
+    data = np.ascontiguousarray(points)
+    # Το SHA-1 εδώ δεν έχει ρόλο ασφάλειας: είναι το ταχύτερο digest του hashlib
+    # (hardware-accelerated στους περισσότερους x86/ARM επεξεργαστές)
+    digest = hashlib.sha1(memoryview(data).cast('B'), usedforsecurity=False).digest()
+    key = (digest, data.shape, data.dtype.str, algorithm, precision)
+    
+    hull = _HULL_CACHE.get(key)
+    if hull is not None:
+        _HULL_CACHE.move_to_end(key)
+        return hull
+    
+    hull = ConvexHull2D(points, precision=precision).compute_hull(algorithm)
+    _HULL_CACHE[key] = hull
+    if len(_HULL_CACHE) > HULL_CACHE_SIZE:
+        _HULL_CACHE.popitem(last=False)
+    return hull
+
+
 # Utility function για εύκολη χρήση
-def compute_convex_hull(points: List[Point2D], algorithm: str = "graham") -> List[Point2D]:
+def compute_convex_hull(points: Union[np.ndarray, List[Point2D]],
+                        algorithm: str = "andrew",
+                        precision: str = "float64",
+                        cache: bool = False) -> Union[np.ndarray, List[Point2D]]:
     """
     Υπολογίζει το convex hull με τον επιλεγμένο αλγόριθμο.
     
     Args:
-        points: Λίστα από Point2D
-        algorithm: "graham" ή "quick" (μόνο graham υλοποιημένο προς το παρόν)
+        points: Λίστα από Point2D ή ndarray shape (n, 2). Το ndarray περνά
+                απευθείας στον SoA kernel χωρίς κατασκευή Point2D objects.
+        algorithm: "andrew", "graham" ή "quick" (το quick δεν έχει υλοποιηθεί ακόμα)
+        precision: "float64" (default) ή "float32", βλ. ConvexHull2D
+        cache: Για ndarray input, κρατά τα τελευταία HULL_CACHE_SIZE hulls με
+               κλειδί ένα digest του περιεχομένου του array, ώστε
+               επαναλαμβανόμενες κλήσεις με τα ίδια σημεία να μην ξανατρέχουν
+               τον αλγόριθμο. Αγνοείται για λίστα από Point2D.
     
     Returns:
-        Λίστα με τα σημεία του convex hull
+        Τα σημεία του convex hull: λίστα από Point2D για λίστα input,
+        ndarray shape (h, 2) για ndarray input
     """
-    if algorithm == "graham":
-        ch = ConvexHull2D(points)
-        return ch.compute_hull()
+    if algorithm in ("andrew", "graham"):
+        if cache and isinstance(points, np.ndarray):
+            hull = _cached_hull(points, algorithm, precision)
+            # Αντίγραφο, ώστε ο caller να μην μπορεί να αλλάξει το cached αποτέλεσμα
+            return hull.copy()
+        ch = ConvexHull2D(points, precision=precision)
+        return ch.compute_hull(algorithm)
     elif algorithm == "quick":
         return quick_hull(points)
     else:
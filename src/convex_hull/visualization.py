@@ -2,14 +2,21 @@
 """Visualization utilities για Convex Hull"""
 
 import matplotlib.pyplot as plt
-from typing import List, Optional
+from typing import List, Optional, Union
 import numpy as np
 
 from src.utils.geometry import Point2D
 
 
-def plot_convex_hull(points: List[Point2D], 
-                    hull: List[Point2D], 
+def _as_array(points: Union[np.ndarray, List[Point2D]]) -> np.ndarray:
+    """Μετατρέπει λίστα από Point2D ή ndarray σε ndarray shape (n, 2)"""
+    if isinstance(points, np.ndarray):
+        return points
+    return np.array([[p.x, p.y] for p in points], dtype=np.float64).reshape(-1, 2)
+
+
+def plot_convex_hull(points: Union[np.ndarray, List[Point2D]], 
+                    hull: Union[np.ndarray, List[Point2D]], 
                     title: str = "Convex Hull",
                     save_path: Optional[str] = None,
                     show_plot: bool = True):
@@ -17,34 +24,32 @@ def plot_convex_hull(points: List[Point2D],
     Απεικονίζει τα σημεία και το convex hull τους.
     
     Args:
-        points: Όλα τα σημεία
-        hull: Τα σημεία του convex hull
+        points: Όλα τα σημεία (λίστα Point2D ή ndarray shape (n, 2))
+        hull: Τα σημεία του convex hull (λίστα Point2D ή ndarray shape (h, 2))
         title: Τίτλος του plot
         save_path: Path για αποθήκευση (optional)
         show_plot: Αν θα εμφανιστεί το plot
     """
+    pts = _as_array(points)
+    hull_pts = _as_array(hull)
+    
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Plot όλα τα σημεία
-    x_coords = [p.x for p in points]
-    y_coords = [p.y for p in points]
-    ax.scatter(x_coords, y_coords, c='blue', s=50, label='Points', zorder=5)
+    ax.scatter(pts[:, 0], pts[:, 1], c='blue', s=50, label='Points', zorder=5)
     
     # Plot το hull
-    if hull:
-        hull_x = [p.x for p in hull] + [hull[0].x]  # Κλείσιμο του polygon
-        hull_y = [p.y for p in hull] + [hull[0].y]
+    if len(hull_pts):
+        closed = np.vstack([hull_pts, hull_pts[:1]])  # Κλείσιμο του polygon
         
         # Γέμισμα του hull
-        ax.fill(hull_x, hull_y, alpha=0.3, c='green', label='Convex Hull')
+        ax.fill(closed[:, 0], closed[:, 1], alpha=0.3, c='green', label='Convex Hull')
         
         # Περίγραμμα του hull
-        ax.plot(hull_x, hull_y, 'r-', linewidth=2, label='Hull Boundary')
+        ax.plot(closed[:, 0], closed[:, 1], 'r-', linewidth=2, label='Hull Boundary')
         
         # Σημεία του hull
-        hull_x_points = [p.x for p in hull]
-        hull_y_points = [p.y for p in hull]
-        ax.scatter(hull_x_points, hull_y_points, c='red', s=100, 
+        ax.scatter(hull_pts[:, 0], hull_pts[:, 1], c='red', s=100, 
                   marker='o', edgecolors='black', linewidth=2, 
                   label='Hull Vertices', zorder=10)
     
@@ -58,11 +63,9 @@ def plot_convex_hull(points: List[Point2D],
     ax.set_aspect('equal', adjustable='box')
     
     # Προσθήκη padding
-    if points:
-        x_min = min(p.x for p in points)
-        x_max = max(p.x for p in points)
-        y_min = min(p.y for p in points)
-        y_max = max(p.y for p in points)
+    if len(pts):
+        x_min, y_min = pts.min(axis=0)
+        x_max, y_max = pts.max(axis=0)
         
         x_range = x_max - x_min
         y_range = y_max - y_min
@@ -83,17 +86,20 @@ def plot_convex_hull(points: List[Point2D],
         plt.close()
 
 
-def plot_algorithm_progress(points: List[Point2D], 
-                          steps: List[List[Point2D]], 
+def plot_algorithm_progress(points: Union[np.ndarray, List[Point2D]], 
+                          steps: List[Union[np.ndarray, List[Point2D]]], 
                           save_dir: Optional[str] = None):
     """
     Δημιουργεί animation-style plots που δείχνουν την πρόοδο του αλγορίθμου.
     
     Args:
-        points: Αρχικά σημεία
+        points: Αρχικά σημεία (λίστα Point2D ή ndarray shape (n, 2))
         steps: Λίστα με τα βήματα του hull σε κάθε iteration
         save_dir: Directory για αποθήκευση των plots
     """
+    # Μία μετατροπή για όλα τα βήματα
+    points = _as_array(points)
+    
     for i, hull_step in enumerate(steps):
         title = f"Graham Scan - Step {i+1}/{len(steps)}"
         save_path = f"{save_dir}/step_{i+1:03d}.png" if save_dir else None
@@ -102,7 +108,7 @@ def plot_algorithm_progress(points: List[Point2D],
                         save_path=save_path, show_plot=False)
 
 
-def create_comparison_plot(points: List[Point2D],
+def create_comparison_plot(points: Union[np.ndarray, List[Point2D]],
                          hulls: dict,
                          title: str = "Algorithm Comparison",
                          save_path: Optional[str] = None):
@@ -110,9 +116,11 @@ def create_comparison_plot(points: List[Point2D],
     Συγκρίνει διαφορετικούς αλγορίθμους convex hull.
     
     Args:
-        points: Input points
-        hulls: Dictionary με {algorithm_name: hull_points}
+        points: Input points (λίστα Point2D ή ndarray shape (n, 2))
+        hulls: Dictionary με {algorithm_name: hull_points}, όπου κάθε hull
+               είναι λίστα Point2D ή ndarray shape (h, 2)
     """
+    pts = _as_array(points)
     n_algorithms = len(hulls)
     fig, axes = plt.subplots(1, n_algorithms, figsize=(6*n_algorithms, 5))
     
@@ -121,16 +129,14 @@ def create_comparison_plot(points: List[Point2D],
     
     for ax, (algo_name, hull) in zip(axes, hulls.items()):
         # Plot points
-        x_coords = [p.x for p in points]
-        y_coords = [p.y for p in points]
-        ax.scatter(x_coords, y_coords, c='blue', s=30, alpha=0.6)
+        ax.scatter(pts[:, 0], pts[:, 1], c='blue', s=30, alpha=0.6)
         
         # Plot hull
-        if hull:
-            hull_x = [p.x for p in hull] + [hull[0].x]
-            hull_y = [p.y for p in hull] + [hull[0].y]
-            ax.fill(hull_x, hull_y, alpha=0.3, c='green')
-            ax.plot(hull_x, hull_y, 'r-', linewidth=2)
+        hull_pts = _as_array(hull)
+        if len(hull_pts):
+            closed = np.vstack([hull_pts, hull_pts[:1]])
+            ax.fill(closed[:, 0], closed[:, 1], alpha=0.3, c='green')
+            ax.plot(closed[:, 0], closed[:, 1], 'r-', linewidth=2)
         
         ax.set_title(algo_name)
         ax.set_aspect('equal')
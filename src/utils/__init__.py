@@ -1,10 +1,11 @@
 """Utility functions and classes for the project"""
 
-from .geometry import Point2D, Point3D, Line, Segment, orientation, ccw, polar_angle
+from .geometry import (Point2D, Point3D, Line, Segment, orientation, ccw, polar_angle,
+                       points_from_array)
 from .performance import Timer, measure_time, measure_time_and_memory, benchmark_function
 
 __all__ = [
     'Point2D', 'Point3D', 'Line', 'Segment', 
-    'orientation', 'ccw', 'polar_angle',
+    'orientation', 'ccw', 'polar_angle', 'points_from_array',
     'Timer', 'measure_time', 'measure_time_and_memory', 'benchmark_function'
 ]
\ No newline at end of file
@@ -8,6 +8,9 @@ from typing import List, Tuple, Optional
 class Point2D:
     """Σημείο στο 2D επίπεδο"""
     
+    # Χωρίς __dict__ ανά instance: μικρότερα objects για μεγάλα σύνολα σημείων
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -20,6 +23,10 @@ class Point2D:
             return False
         return self.x == other.x and self.y == other.y
     
+    def __hash__(self):
+        """Συμβατό με το __eq__, ώστε τα σημεία να μπαίνουν σε sets και dicts"""
+        return hash((self.x, self.y))
+    
     def __lt__(self, other):
         """Για sorting: πρώτα κατά x, μετά κατά y"""
         if self.x != other.x:
@@ -40,6 +47,8 @@ class Point2D:
 class Point3D:
     """Σημείο στο 3D χώρο (για R-trees αργότερα)"""
     
+    __slots__ = ('x', 'y', 'z')
+    
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -109,4 +118,13 @@ def polar_angle(origin: Point2D, point: Point2D) -> float:
     """
     dx = point.x - origin.x
     dy = point.y - origin.y
-    return math.atan2(dy, dx)
\ No newline at end of file
+    return math.atan2(dy, dx)
+
+
+def points_from_array(coords) -> List[Point2D]:
+    """
+    Μετατρέπει ndarray shape (n, 2) σε λίστα από Point2D.
+    
+    Χρήσιμο για κώδικα που δουλεύει ακόμα με Point2D objects.
+    """
+    return [Point2D(x, y) for x, y in coords.tolist()]
\ No newline at end of file
@@ -7,24 +7,44 @@ import psutil
 import os
 from typing import Callable, Any, Tuple
 
+# Το process object δημιουργείται μία φορά ανά process, ώστε κάθε μέτρηση να μην
+# πληρώνει το lookup του
+_PROC = None
+
+
+def _proc() -> psutil.Process:
+    """Το psutil.Process του τρέχοντος process, ξαναδημιουργείται μετά από fork"""
+    global _PROC
+    if _PROC is None or _PROC.pid != os.getpid():
+        _PROC = psutil.Process(os.getpid())
+    return _PROC
+
 
 class Timer:
-    """Context manager για μέτρηση χρόνου εκτέλεσης"""
+    """
+    Context manager για μέτρηση χρόνου εκτέλεσης.
+    
+    Τα start_time / end_time είναι ακέραια ns (time.perf_counter_ns), ενώ το
+    elapsed είναι σε seconds. Με verbose=False δεν τυπώνεται τίποτα, ώστε το
+    Timer να μπορεί να χρησιμοποιηθεί μέσα σε benchmark loops.
+    """
     
-    def __init__(self, name: str = "Operation"):
+    def __init__(self, name: str = "Operation", verbose: bool = True):
         self.name = name
+        self.verbose = verbose
         self.start_time = None
         self.end_time = None
         self.elapsed = None
     
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.perf_counter()
-        self.elapsed = self.end_time - self.start_time
-        print(f"{self.name} took {self.elapsed:.6f} seconds")
+        self.end_time = time.perf_counter_ns()
+        self.elapsed = (self.end_time - self.start_time) * 1e-9
+        if self.verbose:
+            print(f"{self.name} took {self.elapsed:.6f} seconds")
 
 
 def measure_time(func: Callable) -> Callable:
@@ -48,19 +68,18 @@ def measure_time_and_memory(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # Μέτρηση αρχικής μνήμης
-        process = psutil.Process(os.getpid())
-        mem_before = process.memory_info().rss / 1024 / 1024  # MB
+        mem_before = _proc().memory_info().rss / 1024 / 1024  # MB
         
-        # Εκτέλεση και μέτρηση χρόνου
-        start = time.perf_counter()
+        # Εκτέλεση και μέτρηση χρόνου (ακέραια ns για ακρίβεια σε sub-µs διάρκειες)
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time.perf_counter()
+        end = time.perf_counter_ns()
         
         # Μέτρηση τελικής μνήμης
-        mem_after = process.memory_info().rss / 1024 / 1024  # MB
+        mem_after = _proc().memory_info().rss / 1024 / 1024  # MB
         mem_used = mem_after - mem_before
         
-        elapsed = end - start
+        elapsed = (end - start) * 1e-9
         print(f"{func.__name__}:")
         print(f"  Time: {elapsed:.6f} seconds")
         print(f"  Memory: {mem_used:.2f} MB")
@@ -81,10 +100,9 @@ def benchmark_function(func: Callable, *args, n_runs: int = 10, **kwargs) -> Tup
     
     times = []
     for _ in range(n_runs):
-        start = time.perf_counter()
-        func(*args, **kwargs)
-        end = time.perf_counter()
-        times.append(end - start)
+        with Timer(verbose=False) as timer:
+            func(*args, **kwargs)
+        times.append(timer.elapsed)
     
     return np.mean(times), np.std(times)
 
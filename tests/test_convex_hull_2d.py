@@ -0,0 +1,182 @@
+"""Tests για το 2D Convex Hull"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.convex_hull import convex_hull_2d
+from src.convex_hull.convex_hull_2d import ConvexHull2D, compute_convex_hull
+from src.utils.geometry import Point2D
+
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+
+# Τετράγωνο με εσωτερικά σημεία και σημεία πάνω στις πλευρές
+SQUARE_WITH_EXTRAS = SQUARE + [(2, 2), (1, 3), (2, 0), (4, 1), (0, 2), (3, 4)]
+
+ALGORITHMS = ["andrew", "graham"]
+
+
+def vertex_set(hull):
+    """Τα vertices του hull ως set από tuples, ανεξάρτητα από το σημείο εκκίνησης"""
+    if isinstance(hull, np.ndarray):
+        return set(map(tuple, hull.tolist()))
+    return {(p.x, p.y) for p in hull}
+
+
+def signed_area(hull) -> float:
+    """Θετικό για counter-clockwise σειρά"""
+    pts = np.asarray(hull, dtype=np.float64)
+    xs, ys = pts[:, 0], pts[:, 1]
+    return 0.5 * (np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1)))
+
+
+@pytest.fixture
+def random_points():
+    return np.random.default_rng(42).uniform(0, 100, (5000, 2))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_square_with_interior_and_boundary_points(algorithm):
+    hull = compute_convex_hull(np.array(SQUARE_WITH_EXTRAS, dtype=float), algorithm)
+
+    assert vertex_set(hull) == set(SQUARE)
+    assert len(hull) == 4
+    assert signed_area(hull) > 0
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_area_and_perimeter(algorithm):
+    ch = ConvexHull2D(np.array(SQUARE_WITH_EXTRAS, dtype=float))
+    ch.compute_hull(algorithm)
+
+    assert ch.get_hull_area() == pytest.approx(16.0)
+    assert ch.get_hull_perimeter() == pytest.approx(16.0)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_collinear_points(algorithm):
+    points = np.array([(2, 2), (0, 0), (3, 3), (1, 1), (3, 3)], dtype=float)
+    hull = compute_convex_hull(points, algorithm)
+
+    assert vertex_set(hull) == {(0, 0), (3, 3)}
+    assert len(hull) == 2
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_duplicate_points(algorithm):
+    points = np.array(SQUARE * 3 + [(2, 2), (2, 2)], dtype=float)
+    hull = compute_convex_hull(points, algorithm)
+
+    assert vertex_set(hull) == set(SQUARE)
+    assert len(hull) == 4
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_all_points_identical(algorithm):
+    hull = compute_convex_hull(np.ones((5, 2)), algorithm)
+
+    assert hull.tolist() == [[1.0, 1.0]]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_point2d_list_returns_input_objects(algorithm):
+    points = [Point2D(x, y) for x, y in SQUARE_WITH_EXTRAS]
+    hull = compute_convex_hull(points, algorithm)
+
+    assert isinstance(hull, list)
+    assert vertex_set(hull) == set(SQUARE)
+    assert all(any(h is p for p in points) for h in hull)
+
+
+def test_algorithms_agree_on_random_points(random_points):
+    andrew = ConvexHull2D(random_points).andrew_monotone_chain()
+    graham = ConvexHull2D(random_points).graham_scan()
+
+    assert vertex_set(andrew) == vertex_set(graham)
+    assert signed_area(andrew) == pytest.approx(signed_area(graham))
+
+
+def test_parallel_hull_matches_sequential(random_points, monkeypatch):
+    # Εξαναγκασμός του parallel path και για μικρό input
+    monkeypatch.setattr(convex_hull_2d, "PARALLEL_MIN_POINTS", 1000)
+
+    expected = ConvexHull2D(random_points).andrew_monotone_chain()
+    hull = ConvexHull2D(random_points).parallel_hull(num_workers=2)
+
+    assert vertex_set(hull) == vertex_set(expected)
+    assert signed_area(hull) > 0
+
+
+def test_parallel_hull_concurrent_calls(monkeypatch):
+    monkeypatch.setattr(convex_hull_2d, "PARALLEL_MIN_POINTS", 1000)
+    rng = np.random.default_rng(7)
+    # Διαφορετικά σύνολα σημείων με ξένα μεταξύ τους hulls
+    inputs = [rng.uniform(0, 100, (5000, 2)) + 1000 * k for k in range(4)]
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        hulls = list(executor.map(lambda pts: ConvexHull2D(pts).parallel_hull(num_workers=2), inputs))
+
+    for points, hull in zip(inputs, hulls):
+        assert vertex_set(hull) == vertex_set(ConvexHull2D(points).andrew_monotone_chain())
+
+
+def test_float32_cull_after_float64_call(random_points, monkeypatch):
+    # Ένας προηγούμενος float64 υπολογισμός δεν πρέπει να αλλάζει το dtype
+    # με το οποίο γίνεται το culling ενός float32 input
+    ConvexHull2D(random_points).andrew_monotone_chain()
+
+    dtypes = []
+    original = convex_hull_2d.orientation_arr
+
+    def recording_orientation(*args):
+        result = original(*args)
+        dtypes.append(result.dtype)
+        return result
+
+    monkeypatch.setattr(convex_hull_2d, "orientation_arr", recording_orientation)
+    ConvexHull2D(random_points, precision="float32").andrew_monotone_chain()
+
+    assert dtypes and all(dtype == np.float32 for dtype in dtypes)
+
+
+def test_float32_precision_matches_float64(random_points):
+    ch32 = ConvexHull2D(random_points, precision="float32")
+    ch64 = ConvexHull2D(random_points)
+    hull32 = ch32.andrew_monotone_chain()
+    hull64 = ch64.andrew_monotone_chain()
+
+    assert ch32.xs.dtype == np.float32
+    assert vertex_set(hull32) == vertex_set(hull64)
+    # Τα σημεία και οι μετρικές προέρχονται από το αρχικό float64 input
+    assert hull32.dtype == np.float64
+    assert ch32.get_hull_area() == pytest.approx(ch64.get_hull_area(), rel=1e-12)
+
+
+def test_invalid_precision():
+    with pytest.raises(ValueError):
+        ConvexHull2D(np.array(SQUARE, dtype=float), precision="float16")
+
+
+def test_cached_hull(random_points):
+    expected = compute_convex_hull(random_points)
+    first = compute_convex_hull(random_points, cache=True)
+    second = compute_convex_hull(random_points, cache=True)
+
+    assert np.array_equal(first, expected)
+    assert np.array_equal(second, expected)
+
+    # Ο caller παίρνει αντίγραφο και δεν μπορεί να αλλάξει το cached αποτέλεσμα
+    second[:] = 0
+    assert np.array_equal(compute_convex_hull(random_points, cache=True), expected)
+
+
+def test_cached_hull_sees_in_place_changes(random_points):
+    points = random_points.copy()
+    compute_convex_hull(points, cache=True)
+
+    points[0] = (-1.0, -1.0)
+    hull = compute_convex_hull(points, cache=True)
+
+    assert (-1.0, -1.0) in vertex_set(hull)
@@ -0,0 +1,27 @@
+"""Tests για τους generators σημείων του convex hull demo"""
+
+import numpy as np
+
+from demos.convex_hull_demo import (generate_random_points, generate_circle_points,
+                                    generate_clusters)
+
+
+def test_generate_random_points():
+    points = generate_random_points(500, x_range=(0, 10), y_range=(20, 30), seed=1)
+
+    assert points.shape == (500, 2)
+    assert np.all((points[:, 0] >= 0) & (points[:, 0] <= 10))
+    assert np.all((points[:, 1] >= 20) & (points[:, 1] <= 30))
+
+
+def test_generate_circle_points():
+    points = generate_circle_points(100, center=(5, 5), radius=2)
+
+    assert points.shape == (100, 2)
+    assert np.allclose(np.hypot(points[:, 0] - 5, points[:, 1] - 5), 2)
+
+
+def test_generate_clusters():
+    points = generate_clusters(n_clusters=4, points_per_cluster=25)
+
+    assert points.shape == (100, 2)
@@ -0,0 +1,36 @@
+"""Tests για τα γεωμετρικά utilities"""
+
+import numpy as np
+
+from src.utils.geometry import Point2D, ccw, orientation
+
+
+def test_ccw_and_orientation():
+    a, b = Point2D(0, 0), Point2D(4, 0)
+
+    assert ccw(a, b, Point2D(2, 1))
+    assert orientation(a, b, Point2D(2, 1)) == 2
+    assert not ccw(a, b, Point2D(2, -1))
+    assert orientation(a, b, Point2D(2, -1)) == 1
+    assert not ccw(a, b, Point2D(2, 0))
+    assert orientation(a, b, Point2D(2, 0)) == 0
+
+
+def test_ccw_consistent_with_orientation_near_collinear():
+    # Σημεία πάνω σε ένα ευθύγραμμο τμήμα, όπου το αποτέλεσμα εξαρτάται από
+    # σφάλματα στρογγυλοποίησης: τα δύο helpers πρέπει να συμφωνούν
+    rng = np.random.default_rng(0)
+    a, b = Point2D(0.1, 0.3), Point2D(7.7, 5.9)
+    for t in rng.uniform(0, 1, 2000).tolist():
+        p = Point2D(a.x + t * (b.x - a.x), a.y + t * (b.y - a.y))
+        assert ccw(a, b, p) == (orientation(a, b, p) == 2)
+
+
+def test_point2d_hash_consistent_with_eq():
+    points = {Point2D(1, 2), Point2D(1.0, 2.0), Point2D(2, 1), Point2D(0.0, -0.0)}
+
+    assert len(points) == 3
+    assert Point2D(1, 2) in points
+    assert Point2D(0, 0) in points
+    assert Point2D(1, 3) not in points
+    assert {Point2D(1, 2): "a"}[Point2D(1.0, 2.0)] == "a"
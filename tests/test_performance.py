@@ -0,0 +1,30 @@
+"""Tests για τα performance utilities"""
+
+import functools
+
+from src.utils.performance import Timer, benchmark_function
+
+
+def test_timer_verbose(capsys):
+    with Timer("Sorting") as timer:
+        sorted(range(1000))
+
+    assert isinstance(timer.start_time, int) and isinstance(timer.end_time, int)
+    assert timer.elapsed == (timer.end_time - timer.start_time) * 1e-9
+    assert capsys.readouterr().out.startswith("Sorting took ")
+
+
+def test_timer_not_verbose(capsys):
+    with Timer("Sorting", verbose=False) as timer:
+        sorted(range(1000))
+
+    assert timer.elapsed >= 0
+    assert capsys.readouterr().out == ""
+
+
+def test_benchmark_function_without_name(capsys):
+    # Ένα functools.partial δεν έχει __name__
+    mean_time, std_time = benchmark_function(functools.partial(sorted, range(1000)), n_runs=3)
+
+    assert mean_time >= 0 and std_time >= 0
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,56 @@
+"""Tests για τα visualization utilities του convex hull"""
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from src.convex_hull.visualization import plot_convex_hull, create_comparison_plot
+from src.utils.geometry import Point2D, points_from_array
+
+
+POINTS = np.array([(0, 0), (4, 0), (4, 4), (0, 4), (2, 2)], dtype=float)
+HULL = POINTS[:4]
+
+
+@pytest.fixture(autouse=True)
+def no_show(monkeypatch):
+    # Τα figures μένουν ανοιχτά ώστε να ελεγχθεί τι σχεδιάστηκε
+    monkeypatch.setattr(plt, "show", lambda: None)
+    yield
+    plt.close("all")
+
+
+def plotted_hull(ax) -> np.ndarray:
+    """Οι συντεταγμένες του περιγράμματος του hull σε ένα axes"""
+    return np.asarray(ax.lines[0].get_xydata())
+
+
+@pytest.mark.parametrize("as_points", [False, True])
+def test_plot_convex_hull(as_points):
+    points, hull = POINTS, HULL
+    if as_points:
+        points, hull = points_from_array(points), points_from_array(hull)
+
+    plot_convex_hull(points, hull)
+    ax = plt.gcf().axes[0]
+
+    assert np.array_equal(ax.collections[0].get_offsets(), POINTS)
+    assert np.array_equal(plotted_hull(ax), np.vstack([HULL, HULL[:1]]))
+
+
+def test_create_comparison_plot_mixed_inputs():
+    create_comparison_plot(POINTS, {"andrew": HULL, "graham": points_from_array(HULL)})
+    axes = plt.gcf().axes
+
+    assert [ax.get_title() for ax in axes] == ["andrew", "graham"]
+    for ax in axes:
+        assert np.array_equal(ax.collections[0].get_offsets(), POINTS)
+        assert np.array_equal(plotted_hull(ax), np.vstack([HULL, HULL[:1]]))
+
+
+def test_plot_convex_hull_empty_hull():
+    plot_convex_hull([Point2D(0, 0), Point2D(1, 1)], [])
+
+    assert not plt.gcf().axes[0].lines